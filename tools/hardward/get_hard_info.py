@@ -1,19 +1,58 @@
 
-from email.policy import default
+import os
 import psutil
 import platform
+import socket
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-# GPU information
-import GPUtil
+from functools import cache
+from types import SimpleNamespace
 import click 
-import json 
 from pathlib import Path
 try:
-    from rich.pretty import pprint
-    from rich import print
-except:
-    from pprint import pprint
+    import orjson
+except ImportError:
+    orjson = None
+    import json
+# GPU information, read in-process through NVML instead of nvidia-smi
+try:
+    import pynvml
+except ImportError:
+    pynvml = None
+else:
+    try:
+        pynvml.nvmlInit()
+    except pynvml.NVMLError:
+        # no NVIDIA driver on this machine
+        pynvml = None
+
+__all__ = ['hardware_info']
+
+# bind the psutil/platform calls used by the probes once, so repeated probing
+# (e.g. from a long-running caller) skips the module attribute lookups
+_boot_time = psutil.boot_time
+_cpu_count = psutil.cpu_count
+_cpu_freq = psutil.cpu_freq
+_cpu_percent = psutil.cpu_percent
+_disk_io_counters = psutil.disk_io_counters
+_disk_partitions = psutil.disk_partitions
+_disk_usage = psutil.disk_usage
+_net_if_addrs = psutil.net_if_addrs
+_net_io_counters = psutil.net_io_counters
+_swap_memory = psutil.swap_memory
+_virtual_memory = psutil.virtual_memory
+_uname = platform.uname
+_AF_INET = socket.AF_INET
+_AF_LINK = psutil.AF_LINK
+
+# prime psutil's cpu_percent counters so later non-blocking reads have a baseline
+_cpu_percent(percpu=True, interval=None)
+_cpu_percent(interval=None)
+
 
+_UNITS = ("", "K", "M", "G", "T", "P", "E")
 
 def get_size(bytes, suffix="B")->str:
     """
@@ -22,16 +61,58 @@ def get_size(bytes, suffix="B")->str:
         1253656 => '1.20MB'
         1253656678 => '1.17GB'
     """
-    factor = 1024
-    for unit in ["", "K", "M", "G", "T", "P"]:
-        if bytes < factor:
-            return f"{bytes:.2f}{unit}{suffix}"
-        bytes /= factor
+    if bytes < 1024:
+        return f"{bytes:.2f}{suffix}"
+    # every unit is 2**10 larger, so the bit length picks it directly
+    i = min((int(bytes).bit_length() - 1) // 10, len(_UNITS) - 1)
+    return f"{bytes / (1 << (10 * i)):.2f}{_UNITS[i]}{suffix}"
 
 
+# probes return raw numbers; the unit lives in the key suffix and is only
+# rendered for display by _humanize()
+_UNIT_FORMATS = {
+    " (bytes)": get_size,
+    " (MHz)": lambda v: f"{v:.2f}Mhz",
+    " (%)": lambda v: f"{v}%",
+    " (°C)": lambda v: f"{v}°C",
+}
+
+def _humanize(data):
+    """Render the raw numbers of a probe result in human readable units"""
+    if isinstance(data, list):
+        return [_humanize(item) for item in data]
+    if not isinstance(data, dict):
+        return data
+    out = {}
+    for key, value in data.items():
+        for suffix, fmt in _UNIT_FORMATS.items():
+            if key.endswith(suffix):
+                if isinstance(value, list):
+                    value = [fmt(v) for v in value]
+                elif value is not None:
+                    value = fmt(value)
+                out[key[:-len(suffix)]] = value
+                break
+        else:
+            out[key] = _humanize(value)
+    return out
+
+
+def _snapshot() -> SimpleNamespace:
+    """Read the psutil counters shared by the formatters in one go"""
+    return SimpleNamespace(
+        vm=_virtual_memory(),
+        swap=_swap_memory(),
+        dio=_disk_io_counters(),
+        nio=_net_io_counters(),
+        cpuf=_cpu_freq(),
+    )
+
+
+@cache
 def system_info()-> dict:
     """OS system information"""
-    uname = platform.uname()
+    uname = _uname()
     return {
         "System": uname.system,
         "Node Name": uname.node,
@@ -41,62 +122,91 @@ def system_info()-> dict:
         "Processor": uname.processor,
     }
 
+@cache
 def boot_time()-> dict:
     """Boot time or uptime """
     # Boot Time
     # print("="*40, "Boot Time", "="*40)
-    boot_time_timestamp = psutil.boot_time()
+    boot_time_timestamp = _boot_time()
     bt = datetime.fromtimestamp(boot_time_timestamp)
     return {"Boot Time": f"{bt.year}/{bt.month}/{bt.day} {bt.hour}:{bt.minute}:{bt.second}"}
 
-def cpu_info()-> dict:
-    """CPU information"""
+@cache
+def _cpu_static()-> dict:
+    """CPU fields that do not change while the process is running"""
     data = {}
     # number of cores
-    data["Physical cores"] = psutil.cpu_count(logical=False)
-    data["Total cores"] = psutil.cpu_count(logical=True)
-    # CPU frequencies
-    cpufreq = psutil.cpu_freq()
-    data["Max Frequency"] = f"{cpufreq.max:.2f}Mhz"
-    data["Min Frequency"] = f"{cpufreq.min:.2f}Mhz"
-    data["Current Frequency"] = f"{cpufreq.current:.2f}Mhz"
+    data["Physical cores"] = _cpu_count(logical=False)
+    data["Total cores"] = _cpu_count(logical=True)
+    # CPU frequency limits
+    cpufreq = _cpu_freq()
+    data["Max Frequency (MHz)"] = cpufreq.max
+    data["Min Frequency (MHz)"] = cpufreq.min
     return data
 
-def cpu_usage()-> dict:
-    """CPU usage information"""
-    data = {}
-    # print("CPU Usage Per Core:")
-    for i, percentage in enumerate(psutil.cpu_percent(percpu=True, interval=1)):
-        data[f"Core {i}"] =  f"{percentage}%"
-    data["Total CPU Usage"] = f"{psutil.cpu_percent()}%"
+def cpu_info(snap: SimpleNamespace, static: bool = True)-> dict:
+    """CPU information, without the _cpu_static() fields if static is False"""
+    data = dict(_cpu_static()) if static else {}
+    data["Current Frequency (MHz)"] = snap.cpuf.current
     return data
 
-def memory_info()-> dict:
+# long-running callers can drop the memoized core counts/frequency limits
+cpu_info.cache_clear = _cpu_static.cache_clear
+
+def cpu_usage(sample_ms: int = 0)-> dict:
+    """
+    CPU usage information
+    usage is measured since the previous call (or module import);
+    pass sample_ms to measure over a fresh window of that length instead
+    """
+    if sample_ms:
+        _cpu_percent(percpu=True, interval=None)
+        _cpu_percent(interval=None)
+        time.sleep(sample_ms / 1000)
+    # one list indexed by core rather than a "Core N" key per core
+    return {
+        "cores (%)": _cpu_percent(percpu=True, interval=None),
+        "total (%)": _cpu_percent(interval=None),
+    }
+
+def memory_info(snap: SimpleNamespace)-> dict:
     """Memory/RAM information"""
     data = {}
-    svmem = psutil.virtual_memory()
-    data["Total"] = get_size(svmem.total)
-    data["Available"] = get_size(svmem.available)
-    data["Used"] = get_size(svmem.used)
-    data["Percentage"] = f"{svmem.percent}%"
+    svmem = snap.vm
+    data["Total (bytes)"] = svmem.total
+    data["Available (bytes)"] = svmem.available
+    data["Used (bytes)"] = svmem.used
+    data["Percentage (%)"] = svmem.percent
     return data
 
-def swap_memory()-> dict:
+def swap_memory(snap: SimpleNamespace)-> dict:
     """swap memeory information"""
     data = {}
-    swap = psutil.swap_memory()
-    data["Total"] = get_size(swap.total)
-    data["Free"] = get_size(swap.free)
-    data["Used"] = get_size(swap.used)
-    data["Percentage"] = f"{swap.percent}%"
+    swap = snap.swap
+    data["Total (bytes)"] = swap.total
+    data["Free (bytes)"] = swap.free
+    data["Used (bytes)"] = swap.used
+    data["Percentage (%)"] = swap.percent
     return data
 
-def disk_info()-> dict:
+_PSEUDO_FS = ("squashfs", "tmpfs", "devtmpfs", "overlay")
+
+def _physical_partitions()-> list:
+    """
+    Physical disk partitions, skipping pseudo filesystems whose statvfs
+    calls are slow and meaningless (e.g. snap loopback mounts) and
+    mountpoints we cannot search (statvfs needs search permission)
+    """
+    return [
+        p for p in _disk_partitions(all=False)
+        if p.fstype not in _PSEUDO_FS and os.access(p.mountpoint, os.X_OK)
+    ]
+
+def disk_info(partitions: list = None)-> dict:
     """Disc information including mount points"""
     data = {}
-    # get all disk partitions
-    partitions = psutil.disk_partitions()
-    # print((partitions[0]._asdict()))
+    if partitions is None:
+        partitions = _physical_partitions()
     for partition in partitions:
         # print(f">>> {partition}")
         data[partition.device] = {}
@@ -104,107 +214,371 @@ def disk_info()-> dict:
         info["Mountpoint"] =  partition.mountpoint
         info["File system type"] = partition.fstype
         info['opts'] = partition.opts
-        info['maxfile'] = partition.maxfile
-        info['maxpath'] = partition.maxpath
+        # maxfile/maxpath were removed from psutil 6.0
+        info['maxfile'] = getattr(partition, 'maxfile', None)
+        info['maxpath'] = getattr(partition, 'maxpath', None)
         try:
-            partition_usage = psutil.disk_usage(partition.mountpoint)
-        except PermissionError:
-            # this can be catched due to the disk 
+            partition_usage = _disk_usage(partition.mountpoint)
+        except OSError:
+            # the pre-filter is only a fast path: the disk can still be
+            # unmounted or refuse access by the time we stat it
             continue
-        info["Total Size"] =  get_size(partition_usage.total)
-        info["Used"] = get_size(partition_usage.used)
-        info["Free"] = get_size(partition_usage.free)
-        info["Percentage"] = f"{partition_usage.percent}%"
-        return data
+        info["Total Size (bytes)"] = partition_usage.total
+        info["Used (bytes)"] = partition_usage.used
+        info["Free (bytes)"] = partition_usage.free
+        info["Percentage (%)"] = partition_usage.percent
+    return data
 
-def diskio()-> dict:
+def diskio(snap: SimpleNamespace)-> dict:
     """Disc IO statistics since boot"""
     data = {}
-    disk_io = psutil.disk_io_counters()
-    data["Total read"] = get_size(disk_io.read_bytes)
-    data["Total write"] = get_size(disk_io.write_bytes)
+    disk_io = snap.dio
+    data["Total read (bytes)"] = disk_io.read_bytes
+    data["Total write (bytes)"] = disk_io.write_bytes
     return data
 
 def natwork_info()-> dict:
     """All network information (virtual and physical)"""
     data = {}
-    if_addrs = psutil.net_if_addrs()
+    if_addrs = _net_if_addrs()
     for interface_name, interface_addresses in if_addrs.items():
         data[interface_name] = {}
         info = data[interface_name]
         for address in interface_addresses:
-            if str(address.family) == 'AddressFamily.AF_INET':
+            if address.family == _AF_INET:
                 info["IP Address"] =  address.address
                 info["Netmask"] =  address.netmask
                 info["Broadcast IP"] = address.broadcast
-            elif str(address.family) == 'AddressFamily.AF_PACKET':
+            elif address.family == _AF_LINK:
                 info["MAC Address"] = address.address
                 info["Netmask:"] = address.netmask
                 info["Broadcast MAC"] = address.broadcast
     return data 
 
-def io_stats()-> dict:
+def io_stats(snap: SimpleNamespace)-> dict:
     """IO statistics since boot"""
     data = {}
-    net_io = psutil.net_io_counters()
-    data["Total Bytes Sent"] =  get_size(net_io.bytes_sent)
-    data["Total Bytes Received"] =  get_size(net_io.bytes_recv)
+    net_io = snap.nio
+    data["Total Bytes Sent (bytes)"] = net_io.bytes_sent
+    data["Total Bytes Received (bytes)"] = net_io.bytes_recv
     return data
 
-def gpu_stats()-> dict:
-    """GPU stats """
-    ## GPU stats ##
-    data = {"GPU":{}}
-    info = data['GPU']
-    gpus = GPUtil.getGPUs()
-    list_gpus = []
-    for gpu in gpus:
-        info['gpu_id'] = gpu.id
-        info['gpu_uuid'] = gpu.uuid
-        info['gpu_name'] = gpu.name
+def _nvml(query, *args):
+    """
+    Run an NVML query, None if it fails for this board (e.g. NotSupported
+    on MIG-enabled or older GPUs)
+    """
+    try:
+        return query(*args)
+    except pynvml.NVMLError:
+        return None
+
+def _nvml_str(value) -> str:
+    """older pynvml releases return bytes for names/uuids"""
+    return value.decode() if isinstance(value, bytes) else value
+
+@cache
+def _gpu_devices()-> tuple:
+    """NVML handle and identity of each GPU, looked up once"""
+    if pynvml is None:
+        return ()
+    devices = []
+    for i in range(pynvml.nvmlDeviceGetCount()):
+        handle = pynvml.nvmlDeviceGetHandleByIndex(i)
+        devices.append((handle, {
+            'gpu_id': i,
+            'gpu_uuid': _nvml_str(_nvml(pynvml.nvmlDeviceGetUUID, handle)),
+            'gpu_name': _nvml_str(_nvml(pynvml.nvmlDeviceGetName, handle)),
+        }))
+    return tuple(devices)
+
+def _gpu_usage(handle)-> dict:
+    """Load, memory and temperature of one GPU"""
+    unsupported = SimpleNamespace(gpu=None, free=None, used=None, total=None)
+    memory = _nvml(pynvml.nvmlDeviceGetMemoryInfo, handle) or unsupported
+    utilization = _nvml(pynvml.nvmlDeviceGetUtilizationRates, handle) or unsupported
+    return {
         # get % percentage of GPU usage of that GPU
-        info['gpu_load'] = f"{gpu.load * 100}%"
-        info['gpu_free_memory'] = f"{gpu.memoryFree}MB"
-        info['gpu_used_memory'] = f"{gpu.memoryUsed}MB"
-        info['gpu_total_memory'] = f"{gpu.memoryTotal}MB"
-        info['gpu_temperature']  = f"{gpu.temperature}°C"
+        'gpu_load (%)': utilization.gpu,
+        'gpu_free_memory (bytes)': memory.free,
+        'gpu_used_memory (bytes)': memory.used,
+        'gpu_total_memory (bytes)': memory.total,
+        'gpu_temperature (°C)': _nvml(
+            pynvml.nvmlDeviceGetTemperature, handle, pynvml.NVML_TEMPERATURE_GPU
+        ),
+    }
 
-    return data
+def gpu_stats(static: bool = True)-> dict:
+    """GPU stats, identified by gpu_id only if static is False"""
+    ## GPU stats ##
+    return {"GPU": [
+        {**(identity if static else {'gpu_id': identity['gpu_id']}),
+         **_gpu_usage(handle)}
+        for handle, identity in _gpu_devices()
+    ]}
+
+def _probes(sample_ms: int, partitions: list = None, static: bool = True) -> dict:
+    """
+    Probe callables keyed by output section, in display order.
+    With static=False the parts that never change (see _static_sections)
+    are left out.
+    """
+    snap = _snapshot()
+    probes = {
+        'System Information': system_info,
+        'Boot Time': boot_time,
+        "CPU Information": lambda: cpu_info(snap, static),
+        'CPU Usage Per Core': lambda: cpu_usage(sample_ms),
+        'Memory Information': lambda: memory_info(snap),
+        'SWAP Memory': lambda: swap_memory(snap),
+        'Disk Information': lambda: disk_info(partitions),
+        'Disk IO': lambda: diskio(snap),
+        'Network Information': natwork_info,
+        'IO Stat': lambda: io_stats(snap),
+        'gpu_stats': lambda: gpu_stats(static),
+    }
+    if not static:
+        del probes['System Information'], probes['Boot Time']
+    return probes
+
+def _iter_sections(probes: dict, ex: ThreadPoolExecutor = None):
+    """
+    Yield (section, result) pairs in probe order, running the probes on
+    ex (a fresh pool if not given)
+    """
+    if ex is None:
+        with ThreadPoolExecutor(max_workers=8) as ex:
+            yield from _iter_sections(probes, ex)
+        return
+    # sample cpu usage before starting the other probes, otherwise the
+    # window would mostly measure this process's own probing
+    cpu_usage_result = probes['CPU Usage Per Core']()
+    # the rest are independent and mostly I/O bound (statvfs, NVML),
+    # so run them concurrently
+    futures = {
+        key: ex.submit(fn) for key, fn in probes.items()
+        if key != 'CPU Usage Per Core'
+    }
+    for key in probes:
+        if key == 'CPU Usage Per Core':
+            yield key, cpu_usage_result
+        else:
+            # pop so each result can be freed once the caller is done
+            yield key, futures.pop(key).result()
+
+def _collect_probes(probes: dict, ex: ThreadPoolExecutor = None) -> dict:
+    """Run the given probes and return the results in probe order"""
+    return dict(_iter_sections(probes, ex))
+
+def _collect(sample_ms: int) -> dict:
+    """Run every probe and return the raw results keyed by section"""
+    return _collect_probes(_probes(sample_ms))
+
+def _dumps(data) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=4).encode()
+
+def _dumps_line(data) -> bytes:
+    """Compact single-line JSON, for JSON lines output"""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_APPEND_NEWLINE)
+    return json.dumps(data).encode() + b'\n'
+
+def _loads(raw: bytes):
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+def _atomic_write(path: Path, write) -> None:
+    """
+    Call write(fh) on a temporary file next to path and rename it over
+    path, so a failure never leaves a partial file behind
+    """
+    tmp = path.with_name(f'.{path.name}.{os.getpid()}.tmp')
+    try:
+        with open(tmp, 'wb') as fh:
+            write(fh)
+        os.replace(tmp, path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+
+def _write_sections(fh, sections) -> None:
+    """
+    Stream a JSON object to a binary file handle one section at a time,
+    so finished sections can be written out and dropped early
+    """
+    fh.write(b'{')
+    for i, (key, result) in enumerate(sections):
+        fh.write(b',\n' if i else b'\n')
+        fh.write(_dumps(key) + b': ' + _dumps(result))
+    fh.write(b'\n}\n')
+
+def _static_sections()-> dict:
+    """Sections, or parts of them, that do not change while running"""
+    return {
+        'System Information': system_info(),
+        'Boot Time': boot_time(),
+        "CPU Information": _cpu_static(),
+        'gpu_stats': {"GPU": [identity for _, identity in _gpu_devices()]},
+    }
+
+def _guarded(fn):
+    """Wrap a probe so a failure becomes an error field, not an exception"""
+    def probe():
+        try:
+            return fn()
+        except Exception as exc:
+            return {'error': f"{type(exc).__name__}: {exc}"}
+    return probe
+
+def _watch(fh, period: float, sample_ms: int) -> None:
+    """
+    Write one JSON line of the changing sections every period seconds.
+    The static sections are written once, as the first line.
+    """
+    fh.write(_dumps_line(_static_sections()))
+    fh.flush()
+    # the partition list only changes on (un)mount, so enumerate it once
+    # and again only when a partition could not be read
+    partitions = _physical_partitions()
+    next_sample = time.monotonic()
+    with ThreadPoolExecutor(max_workers=8) as ex:
+        while True:
+            sample = {'Timestamp': time.time()}
+            probes = _probes(sample_ms, partitions, static=False)
+            probes = {key: _guarded(fn) for key, fn in probes.items()}
+            sample.update(_collect_probes(probes, ex))
+            fh.write(_dumps_line(sample))
+            fh.flush()
+            disks = sample['Disk Information']
+            if 'error' in disks or any(
+                "Total Size (bytes)" not in info for info in disks.values()
+            ):
+                partitions = _physical_partitions()
+            # after the first sample, cpu usage covers the time since the
+            # previous one, so there is no need to sleep for a sampling window
+            sample_ms = 0
+            # re-anchor after a stall instead of firing the missed samples
+            # back to back
+            next_sample = max(next_sample + period, time.monotonic())
+            time.sleep(max(0.0, next_sample - time.monotonic()))
+
+# per-user location, so other users can neither read nor plant the cache;
+# keyed by host since home directories are often shared between machines
+_CACHE_PATH = (
+    Path(os.environ.get('XDG_CACHE_HOME') or Path.home() / '.cache')
+    / f"hardware_info.{platform.node().replace(os.sep, '_')}.cache.json"
+)
+
+def _read_cache(ttl: int):
+    """Cached JSON bytes if written less than ttl seconds ago, else None"""
+    try:
+        if _CACHE_PATH.stat().st_mtime <= time.time() - ttl:
+            return None
+        raw = _CACHE_PATH.read_bytes()
+        _loads(raw)
+    except (OSError, ValueError):
+        # unreadable or corrupt cache is just a miss
+        return None
+    return raw
+
+def _write_cache(raw: bytes) -> None:
+    try:
+        _CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        _atomic_write(_CACHE_PATH, lambda fh: fh.write(raw))
+    except OSError:
+        # caching is best effort
+        pass
 
 @click.command()
 @click.option(
     '--output', '-o',
     type=click.Path(file_okay=True, dir_okay=False),
     default=None,
-    help='Output file path. returns json files '
+    help='Output file path. returns json files with raw numbers, '
+    'the unit is given in each key'
 
     )
-def hardware_info(output: Path) -> None:
+@click.option(
+    '--sample-ms',
+    type=click.IntRange(min=0),
+    default=50,
+    show_default=True,
+    help='CPU usage sampling window in milliseconds'
+    )
+@click.option(
+    '--ttl',
+    type=click.IntRange(min=0),
+    default=0,
+    show_default=True,
+    help='Reuse results cached by a previous run if younger than this many '
+    'seconds (0 disables the cache)'
+    )
+@click.option(
+    '--watch',
+    type=click.FloatRange(min=0.1),
+    default=None,
+    help='Keep running and write a JSON line every WATCH seconds (at least '
+    '0.1), to the output file (.jsonl) or stdout'
+    )
+def hardware_info(output: Path, sample_ms: int, ttl: int, watch: float) -> None:
     """
     Display hardware information of the local device
     \b
     """
-    data = {}
-    data['System Information'] = system_info()
-    data['Boot Time'] = boot_time()
-    data["CPU Information"] = cpu_info()
-    data['CPU Usage Per Core'] = cpu_usage()
-    data['Memory Information'] = memory_info()
-    data['SWAP Memory'] = swap_memory()
-    data['Disk Information'] = disk_info()
-    data['Disk IO'] = diskio()
-    data['Network Information'] = natwork_info()
-    data['IO Stat'] = io_stats()
-    data['gpu_stats'] = gpu_stats()
+    if watch:
+        try:
+            if output:
+                output = Path(output).with_suffix('.jsonl')
+                if not output.parent.exists():
+                    output.parent.mkdir(parents=True)
+                # append, so a restarted watch keeps the earlier samples
+                with open(output, 'ab') as fh:
+                    _watch(fh, watch, sample_ms)
+            else:
+                _watch(sys.stdout.buffer, watch, sample_ms)
+        except KeyboardInterrupt:
+            pass
+        except BrokenPipeError:
+            # the reader went away (e.g. `| head`); point stdout at devnull
+            # so the interpreter's final flush does not complain again
+            os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        return
+
+    raw = _read_cache(ttl) if ttl else None
 
     if output:
-        output  = Path(output)
+        output  = Path(output).with_suffix('.json')
         if not output.parent.exists():
             output.parent.mkdir(parents=True)
-        with open(output.with_suffix('.json'), 'w') as fh:
-            json.dump(data, fh, indent=4)
+        if raw is not None:
+            output.write_bytes(raw)
+            return
+        _atomic_write(
+            output,
+            lambda fh: _write_sections(fh, _iter_sections(_probes(sample_ms))),
+        )
+        if ttl:
+            _write_cache(output.read_bytes())
+        return
+
+    if raw is not None:
+        data = _loads(raw)
+    else:
+        data = _collect(sample_ms)
+        if ttl:
+            _write_cache(_dumps(data))
 
-    pprint(data, expand_all=True)
+    # rich is slow to import, so only load it when displaying
+    try:
+        from rich.pretty import pprint
+    except ImportError:
+        from pprint import pprint
+        pprint(_humanize(data))
+    else:
+        pprint(_humanize(data), expand_all=True)
 
 if __name__ == "__main__":
     hardware_info()
\ No newline at end of file